@@ -4,20 +4,35 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections.abc import Sequence
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import KumoCloudAPI, KumoCloudAuthError, KumoCloudConnectionError
-from .const import CONF_SITE_ID, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .api import (
+    KumoCloudAPI,
+    KumoCloudAuthError,
+    KumoCloudConnectionError,
+    async_remove_profile_cache,
+)
+from .const import (
+    CONF_SITE_ID,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    TOKEN_EXPIRY_MARGIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared so entities can detect an unchanged missing profile by identity
+_NO_PROFILE: tuple[dict[str, Any], ...] = ()
+
 PLATFORMS: list[Platform] = [Platform.CLIMATE]
 
 
@@ -25,19 +40,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Kumo Cloud from a config entry."""
 
     # Create API client
-    api = KumoCloudAPI(hass)
+    api = KumoCloudAPI(hass, entry.entry_id)
 
     # Initialize with stored tokens if available
     if "access_token" in entry.data:
         api.username = entry.data[CONF_USERNAME]
-        api.access_token = entry.data["access_token"]
-        api.refresh_token = entry.data["refresh_token"]
+        expires_at = None
+        if (expiry_timestamp := entry.data.get("token_expires_at")) is not None:
+            # Stored as a wall-clock timestamp, convert back to monotonic time
+            expires_at = time.monotonic() + expiry_timestamp - time.time()
+        api.set_tokens(
+            entry.data["access_token"], entry.data["refresh_token"], expires_at
+        )
+
+    @callback
+    def _async_save_tokens() -> None:
+        """Persist new tokens so the next startup can reuse them."""
+        hass.config_entries.async_update_entry(
+            entry,
+            data={
+                **entry.data,
+                "access_token": api.access_token,
+                "refresh_token": api.refresh_token,
+                "token_expires_at": api.token_expiry_timestamp,
+            },
+        )
+
+    api.token_update_callback = _async_save_tokens
 
     try:
         # Try to login or refresh tokens
         if not api.access_token:
             await api.login(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD])
-        else:
+        # A token well within its lifetime is trusted until the first refresh
+        elif (
+            api.token_expires_at is None
+            or api.token_expires_at - time.monotonic() <= TOKEN_EXPIRY_MARGIN * 2
+        ):
             # Verify the token works by making a test request
             try:
                 await api.get_account_info()
@@ -50,12 +89,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except KumoCloudConnectionError as err:
         raise ConfigEntryNotReady(f"Unable to connect: {err}") from err
 
+    # Device profiles never change, so reuse the ones fetched last run
+    await api.async_load_profile_cache()
+
     # Create the coordinator
-    coordinator = KumoCloudDataUpdateCoordinator(hass, api, entry.data[CONF_SITE_ID])
+    coordinator = KumoCloudDataUpdateCoordinator(
+        hass, entry, api, entry.data[CONF_SITE_ID]
+    )
 
     # Fetch initial data so we have data when entities are added
     await coordinator.async_config_entry_first_refresh()
 
+    # Keep the access token warm so requests never wait on a refresh
+    api.start_token_refresh()
+
     # Store coordinator in hass data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -69,79 +116,99 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.api.close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the data stored for a config entry."""
+    await async_remove_profile_cache(hass, entry.entry_id)
+
+
 class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Kumo Cloud data."""
 
-    def __init__(self, hass: HomeAssistant, api: KumoCloudAPI, site_id: str) -> None:
+    config_entry: ConfigEntry
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        api: KumoCloudAPI,
+        site_id: str,
+    ) -> None:
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            config_entry=config_entry,
             name=DOMAIN,
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
         self.api = api
         self.site_id = site_id
         self.zones: list[dict[str, Any]] = []
+        # Zones with an indoor unit attached, the only ones with devices
+        self.valid_zones: tuple[dict[str, Any], ...] = ()
         self.devices: dict[str, dict[str, Any]] = {}
         self.device_profiles: dict[str, list[dict[str, Any]]] = {}
 
+    @property
+    def api_counters(self) -> dict[str, int]:
+        """Return the API client's retry and failure counters."""
+        return dict(self.api.counters)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from Kumo Cloud."""
         try:
-            # Get zones for the site
-            zones = await self.api.get_zones(self.site_id)
-
-            # Get device details for each zone
-            devices = {}
-            device_profiles = {}
-
-            for zone in zones:
-                if "adapter" in zone and zone["adapter"]:
-                    device_serial = zone["adapter"]["deviceSerial"]
-
-                    # Get device details and profile in parallel
-                    device_detail_task = self.api.get_device_details(device_serial)
-                    device_profile_task = self.api.get_device_profile(device_serial)
-
-                    device_detail, device_profile = await asyncio.gather(
-                        device_detail_task, device_profile_task
-                    )
-
-                    devices[device_serial] = device_detail
-                    device_profiles[device_serial] = device_profile
-
-            # Store the data for access by entities
-            self.zones = zones
-            self.devices = devices
-            self.device_profiles = device_profiles
-
-            return {
-                "zones": zones,
-                "devices": devices,
-                "device_profiles": device_profiles,
-            }
-
-        except KumoCloudAuthError as err:
-            # Try to refresh token once
             try:
-                await self.api.refresh_access_token()
-                # Retry the request
-                return await self._async_update_data()
-            except KumoCloudAuthError as refresh_err:
-                raise UpdateFailed(
-                    f"Authentication failed: {refresh_err}"
-                ) from refresh_err
+                return await self._async_fetch_data()
+            except KumoCloudAuthError:
+                # Requests already tried a token refresh, so log in again and
+                # retry the fetch once
+                await self.api.login(
+                    self.config_entry.data[CONF_USERNAME],
+                    self.config_entry.data[CONF_PASSWORD],
+                )
+                return await self._async_fetch_data()
+        except KumoCloudAuthError as err:
+            # Neither the refresh token nor the stored password works
+            raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
         except KumoCloudConnectionError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         except Exception as err:
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    async def _async_fetch_data(self) -> dict[str, Any]:
+        """Fetch zones, device details and profiles for the site."""
+        # Get zones for the site
+        zones = await self.api.get_zones(self.site_id)
+        valid_zones = tuple(zone for zone in zones if zone.get("adapter"))
+
+        serials = [zone["adapter"]["deviceSerial"] for zone in valid_zones]
+
+        # Get device details and profiles for all zones in parallel
+        device_details, profiles = await asyncio.gather(
+            self.api.get_devices_bulk(serials),
+            self.api.get_profiles_bulk(serials),
+        )
+        devices = dict(zip(serials, device_details))
+        device_profiles = dict(zip(serials, profiles))
+
+        # Store the data for access by entities
+        self.zones = zones
+        self.valid_zones = valid_zones
+        self.devices = devices
+        self.device_profiles = device_profiles
+
+        return {
+            "zones": zones,
+            "devices": devices,
+            "device_profiles": device_profiles,
+        }
+
     async def async_refresh_device(self, device_serial: str) -> None:
         """Refresh a specific device's data immediately."""
         try:
@@ -152,23 +219,22 @@ class KumoCloudDataUpdateCoordinator(DataUpdateCoordinator):
             self.devices[device_serial] = device_detail
 
             # Also update the zone data if it contains the same info
-            for zone in self.zones:
-                if "adapter" in zone and zone["adapter"]:
-                    if zone["adapter"]["deviceSerial"] == device_serial:
-                        # Update adapter data with fresh device data
-                        zone["adapter"].update(
-                            {
-                                "roomTemp": device_detail.get("roomTemp"),
-                                "operationMode": device_detail.get("operationMode"),
-                                "power": device_detail.get("power"),
-                                "fanSpeed": device_detail.get("fanSpeed"),
-                                "airDirection": device_detail.get("airDirection"),
-                                "spCool": device_detail.get("spCool"),
-                                "spHeat": device_detail.get("spHeat"),
-                                "humidity": device_detail.get("humidity"),
-                            }
-                        )
-                        break
+            for zone in self.valid_zones:
+                if zone["adapter"]["deviceSerial"] == device_serial:
+                    # Update adapter data with fresh device data
+                    zone["adapter"].update(
+                        {
+                            "roomTemp": device_detail.get("roomTemp"),
+                            "operationMode": device_detail.get("operationMode"),
+                            "power": device_detail.get("power"),
+                            "fanSpeed": device_detail.get("fanSpeed"),
+                            "airDirection": device_detail.get("airDirection"),
+                            "spCool": device_detail.get("spCool"),
+                            "spHeat": device_detail.get("spHeat"),
+                            "humidity": device_detail.get("humidity"),
+                        }
+                    )
+                    break
 
             # Update the coordinator's data dict
             self.data = {
@@ -219,10 +285,10 @@ class KumoCloudDevice:
         return self.coordinator.devices.get(self.device_serial, {})
 
     @property
-    def profile_data(self) -> list[dict[str, Any]]:
+    def profile_data(self) -> Sequence[dict[str, Any]]:
         """Get the device profile data."""
         # Always get fresh data from coordinator
-        return self.coordinator.device_profiles.get(self.device_serial, [])
+        return self.coordinator.device_profiles.get(self.device_serial, _NO_PROFILE)
 
     @property
     def available(self) -> bool:
@@ -3,22 +3,43 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from datetime import datetime, timedelta
-from typing import Any
-
-import aiohttp
-from aiohttp import ClientResponseError, ClientTimeout
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+
+from aiohttp import (
+    ClientConnectionError,
+    ClientError,
+    ClientResponse,
+    ClientResponseError,
+    ClientTimeout,
+)
 
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import Store
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_BASE_URL,
     API_VERSION,
     API_APP_VERSION,
+    API_MAX_CONCURRENT_REQUESTS,
+    API_MAX_RETRIES,
+    API_RATE_BURST,
+    API_RATE_LIMIT,
+    API_RETRY_AFTER_MAX_DELAY,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
+    STORAGE_KEY_PROFILES,
+    STORAGE_VERSION,
     TOKEN_REFRESH_INTERVAL,
     TOKEN_EXPIRY_MARGIN,
 )
@@ -38,50 +59,228 @@ class KumoCloudConnectionError(KumoCloudError):
     """Connection error."""
 
 
+class _Retryable(Exception):
+    """Response that should be retried after a backoff."""
+
+    def __init__(self, status: int, retry_after: float | None = None) -> None:
+        """Initialize with the HTTP status and any server-requested delay."""
+        super().__init__(f"HTTP error: {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+# Small account lookups that should fail fast
+_ACCOUNT_ENDPOINTS = frozenset({"/accounts/me", "/sites/"})
+
+# Sent with every request; never mutated
+_BASE_HEADERS = {
+    "x-app-version": API_APP_VERSION,
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+# Commands and small lookups should fail fast; zone and profile reads may be slow
+_TIMEOUT_FAST = ClientTimeout(total=15, connect=5)
+_TIMEOUT_SLOW = ClientTimeout(total=45, connect=15, sock_read=30)
+_TIMEOUT_LOGIN = ClientTimeout(total=10, connect=5)
+
+# Minimum seconds between retry warnings; other retries are only counted
+_RETRY_WARNING_INTERVAL = 300
+
+_T = TypeVar("_T")
+
+
+def _check_status(response: ClientResponse) -> None:
+    """Raise the matching error for any response that is not a success."""
+    status = response.status
+    if status < 300:
+        return
+    if status == 401:
+        raise KumoCloudAuthError("Authentication failed")
+    # Throttled, or a server-side fault that may clear on its own
+    if status == 429 or status >= 500:
+        raise _Retryable(
+            status, _parse_retry_after(response.headers.get("Retry-After"))
+        )
+    raise KumoCloudConnectionError(f"HTTP error: {status}")
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as delta-seconds or an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+async def _decode(response: ClientResponse, method: str) -> Any:
+    """Decode a JSON body straight from bytes, treating an empty body as {}.
+
+    Commands may be acknowledged with a plain-text body, which also reads as {}.
+    """
+    body = await response.read()
+    if not body:
+        return {}
+    try:
+        return json_loads(body)
+    except ValueError as err:
+        if method != "GET":
+            return {}
+        raise KumoCloudConnectionError("Invalid JSON in response") from err
+
+
+def _backoff(
+    attempt: int,
+    retry_after: float | None = None,
+    base: float = API_RETRY_BASE_DELAY,
+    cap: float = API_RETRY_MAX_DELAY,
+    jitter: float = 0.5,
+) -> float:
+    """Return a capped exponential backoff delay with random jitter.
+
+    A server-supplied Retry-After is used as a floor, up to its own ceiling.
+    """
+    delay = min(cap, base * 2**attempt)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, API_RETRY_AFTER_MAX_DELAY))
+    return delay * (1 + random.random() * jitter)
+
+
+def _profile_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, list[dict[str, Any]]]]:
+    """Return the store holding one config entry's device profiles."""
+    return Store(
+        hass, STORAGE_VERSION, STORAGE_KEY_PROFILES.format(entry_id=entry_id)
+    )
+
+
+async def async_remove_profile_cache(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the device profiles saved for a removed config entry."""
+    await _profile_store(hass, entry_id).async_remove()
+
+
+class _TokenBucket:
+    """Token bucket that paces requests to the Kumo Cloud API."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated_at = time.monotonic()
+        # Earliest time any request may go out, pushed back by Retry-After
+        self.paused_until = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last update."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        """Take a token now and return how long until it is actually earned.
+
+        The balance may go negative; later callers then queue behind it.
+        """
+        self._refill()
+        self.tokens -= 1
+        return max(
+            0.0,
+            -self.tokens / self.rate,
+            self.paused_until - self.updated_at,
+        )
+
+    def pause(self, delay: float) -> None:
+        """Hold back every request for delay seconds."""
+        self.paused_until = max(self.paused_until, time.monotonic() + delay)
+
+    async def wait_for_token(self) -> None:
+        """Reserve a token and sleep until it is due."""
+        if (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
+
+    async def wait_for_pause(self) -> None:
+        """Charge a token without queueing, but still wait out any pause."""
+        self.reserve()
+        if (delay := self.paused_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+
 class KumoCloudAPI:
     """Kumo Cloud API client."""
 
-    def __init__(self, hass: HomeAssistant) -> None:
-        """Initialize the API client."""
+    def __init__(self, hass: HomeAssistant, entry_id: str | None = None) -> None:
+        """Initialize the API client.
+
+        Device profiles are only persisted when bound to a config entry.
+        """
         self.hass = hass
         self.session = async_get_clientsession(hass)
         self.base_url = API_BASE_URL
+        self._url_prefix = f"{self.base_url}/{API_VERSION}"
+        self._auth_headers: dict[str, str] = {}
         self.username: str | None = None
         self.access_token: str | None = None
         self.refresh_token: str | None = None
-        self.token_expires_at: datetime | None = None
+        # Monotonic deadline, immune to wall-clock jumps
+        self.token_expires_at: float | None = None
+        self._token_refresh_at: float | None = None
+        self.token_update_callback: Callable[[], None] | None = None
+        self._rate_limiter = _TokenBucket(API_RATE_LIMIT, API_RATE_BURST)
+        self._inflight: dict[tuple[str, str], asyncio.Task[Any]] = {}
+        self._bulk_semaphore = asyncio.Semaphore(API_MAX_CONCURRENT_REQUESTS)
+        self._auto_refresh = False
+        self._refresh_handle: asyncio.TimerHandle | None = None
+        self._refresh_task: asyncio.Task[None] | None = None
+        self._pending_refresh: asyncio.Task[None] | None = None
+        # Device profiles are fixed per serial, so they are kept across restarts
+        self._profile_cache: dict[str, list[dict[str, Any]]] = {}
+        self._profile_store = (
+            None if entry_id is None else _profile_store(hass, entry_id)
+        )
+        self.counters: Counter[str] = Counter()
+        self._last_retry_warning: float | None = None
 
     async def login(self, username: str, password: str) -> dict[str, Any]:
         """Login to Kumo Cloud and return user data."""
-        url = f"{self.base_url}/{API_VERSION}/login"
-        headers = {
-            "x-app-version": API_APP_VERSION,
-            "Content-Type": "application/json",
-        }
-        data = {
-            "username": username,
-            "password": password,
-            "appVersion": API_APP_VERSION,
-        }
+        url = f"{self._url_prefix}/login"
+        body = json_bytes(
+            {
+                "username": username,
+                "password": password,
+                "appVersion": API_APP_VERSION,
+            }
+        )
 
         try:
-            async with asyncio.timeout(30):
-                async with self.session.post(
-                    url, headers=headers, json=data
-                ) as response:
-                    if response.status == 403:
-                        raise KumoCloudAuthError("Invalid username or password")
-                    response.raise_for_status()
-                    result = await response.json()
-
-                    self.username = username
-                    self.access_token = result["token"]["access"]
-                    self.refresh_token = result["token"]["refresh"]
-                    self.token_expires_at = datetime.now() + timedelta(
-                        seconds=TOKEN_REFRESH_INTERVAL
-                    )
-
-                    return result
+            # Expiry counts from when the request was sent, not when it landed
+            sent_at = time.monotonic()
+            async with self.session.post(
+                url, headers=_BASE_HEADERS, data=body, timeout=_TIMEOUT_LOGIN
+            ) as response:
+                if response.status == 403:
+                    raise KumoCloudAuthError("Invalid username or password")
+                response.raise_for_status()
+                result = await response.json(loads=json_loads)
+
+                self.username = username
+                self.set_tokens(
+                    result["token"]["access"],
+                    result["token"]["refresh"],
+                    sent_at + TOKEN_REFRESH_INTERVAL,
+                )
+
+                return result
 
         except asyncio.TimeoutError as err:
             raise KumoCloudConnectionError("Connection timeout") from err
@@ -89,92 +288,283 @@ class KumoCloudAPI:
             if err.status == 403:
                 raise KumoCloudAuthError("Invalid credentials") from err
             raise KumoCloudConnectionError(f"HTTP error: {err.status}") from err
-        except Exception as err:
-            raise KumoCloudConnectionError(f"Unexpected error: {err}") from err
+        except ClientError as err:
+            raise KumoCloudConnectionError(f"Connection error: {err}") from err
+        except (KeyError, TypeError, ValueError) as err:
+            raise KumoCloudConnectionError(f"Invalid login response: {err}") from err
+
+    def set_tokens(
+        self,
+        access_token: str,
+        refresh_token: str,
+        expires_at: float | None = None,
+    ) -> None:
+        """Store new tokens and rebuild the cached request headers."""
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.token_expires_at = expires_at
+        # Fold the safety margin in once so expiry checks are one comparison
+        self._token_refresh_at = (
+            None if expires_at is None else expires_at - TOKEN_EXPIRY_MARGIN
+        )
+        # Shared by every request until the next token change, never mutated
+        self._auth_headers = {
+            **_BASE_HEADERS,
+            "Authorization": f"Bearer {access_token}",
+        }
+        self._schedule_token_refresh()
+        if self.token_update_callback is not None:
+            self.token_update_callback()
+
+    @property
+    def token_expiry_timestamp(self) -> float | None:
+        """Return the token expiry as a wall-clock timestamp for persistence."""
+        if self.token_expires_at is None:
+            return None
+        return time.time() + self.token_expires_at - time.monotonic()
 
     async def refresh_access_token(self) -> None:
-        """Refresh the access token."""
+        """Refresh the access token, sharing one refresh between concurrent callers."""
+        if self._pending_refresh is None or self._pending_refresh.done():
+            self._pending_refresh = self.hass.loop.create_task(
+                self._refresh_access_token()
+            )
+
+        # Shield so one caller being cancelled does not abort the refresh
+        await asyncio.shield(self._pending_refresh)
+
+    async def _refresh_access_token(self) -> None:
+        """Exchange the refresh token for a new token pair."""
         if not self.refresh_token:
             raise KumoCloudAuthError("No refresh token available")
 
-        url = f"{self.base_url}/{API_VERSION}/refresh"
-        headers = {
-            "x-app-version": API_APP_VERSION,
-            "Content-Type": "application/json",
-        }
-        data = {"refresh": self.refresh_token}
-
+        url = f"{self._url_prefix}/refresh"
+        # Encoded once up front; retries resend the same bytes
+        body = json_bytes({"refresh": self.refresh_token})
+
+        async def _call() -> None:
+            sent_at = time.monotonic()
+            async with self.session.post(
+                url, headers=_BASE_HEADERS, data=body, timeout=_TIMEOUT_FAST
+            ) as response:
+                if response.status == 401:
+                    raise KumoCloudAuthError("Refresh token expired")
+                _check_status(response)
+                try:
+                    result = await response.json(loads=json_loads)
+                    access_token = result["access"]
+                    refresh_token = result["refresh"]
+                except (KeyError, TypeError, ValueError) as err:
+                    raise KumoCloudConnectionError(
+                        f"Invalid token refresh response: {err}"
+                    ) from err
+
+            self.set_tokens(
+                access_token, refresh_token, sent_at + TOKEN_REFRESH_INTERVAL
+            )
+
+        await self._call_with_retries("Token refresh", _call)
+
+    def start_token_refresh(self) -> None:
+        """Refresh the access token in the background shortly before it expires."""
+        self._auto_refresh = True
+        self._schedule_token_refresh()
+
+    def _schedule_token_refresh(self, delay: float | None = None) -> None:
+        """(Re)arm the timer that triggers the next background refresh."""
+        if self._refresh_handle is not None:
+            self._refresh_handle.cancel()
+            self._refresh_handle = None
+        if not self._auto_refresh or not self.refresh_token:
+            return
+        if delay is None:
+            # Tokens saved without an expiry may already be stale, refresh now
+            delay = (
+                0.0
+                if self._token_refresh_at is None
+                else max(0.0, self._token_refresh_at - time.monotonic())
+            )
+        self._refresh_handle = self.hass.loop.call_later(
+            delay, self._async_start_scheduled_refresh
+        )
+
+    @callback
+    def _async_start_scheduled_refresh(self) -> None:
+        """Run the scheduled refresh as a background task."""
+        self._refresh_handle = None
+        self._refresh_task = self.hass.async_create_background_task(
+            self._scheduled_refresh(), name="kumo_cloud token refresh"
+        )
+
+    async def _scheduled_refresh(self) -> None:
+        """Refresh the token; a successful refresh re-arms the timer itself."""
         try:
-            async with asyncio.timeout(30):
-                async with self.session.post(
-                    url, headers=headers, json=data
-                ) as response:
-                    if response.status == 401:
-                        raise KumoCloudAuthError("Refresh token expired")
-                    response.raise_for_status()
-                    result = await response.json()
-
-                    self.access_token = result["access"]
-                    self.refresh_token = result["refresh"]
-                    self.token_expires_at = datetime.now() + timedelta(
-                        seconds=TOKEN_REFRESH_INTERVAL
-                    )
-
-        except asyncio.TimeoutError as err:
-            raise KumoCloudConnectionError("Connection timeout during refresh") from err
-        except ClientResponseError as err:
-            if err.status == 401:
-                raise KumoCloudAuthError("Refresh token expired") from err
-            raise KumoCloudConnectionError(
-                f"HTTP error during refresh: {err.status}"
-            ) from err
-
-    async def _ensure_token_valid(self) -> None:
-        """Ensure access token is valid, refresh if needed."""
+            await self.refresh_access_token()
+        except KumoCloudAuthError as err:
+            _LOGGER.warning("Background token refresh failed: %s", err)
+        except KumoCloudConnectionError as err:
+            _LOGGER.debug("Background token refresh failed, will retry: %s", err)
+            self._schedule_token_refresh(API_RETRY_MAX_DELAY)
+
+    async def close(self) -> None:
+        """Stop the background token refresh and any requests still running."""
+        self._auto_refresh = False
+        self._schedule_token_refresh()
+        # The shielded refresh and shared GETs outlive their callers, so they
+        # must be cancelled here or they keep running after unload
+        tasks = [
+            task
+            for task in (
+                self._refresh_task,
+                self._pending_refresh,
+                *self._inflight.values(),
+            )
+            if task is not None and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError, KumoCloudError):
+                await task
+        self._refresh_task = None
+        self._pending_refresh = None
+        self._inflight.clear()
+
+    def _ensure_token_valid(self) -> None:
+        """Ensure an access token is available.
+
+        Refreshing happens on a timer, with a 401 from any request as the fallback.
+        """
         if not self.access_token:
             raise KumoCloudAuthError("No access token available")
 
-        if (
-            self.token_expires_at
-            and datetime.now() + timedelta(seconds=TOKEN_EXPIRY_MARGIN)
-            >= self.token_expires_at
-        ):
-            await self.refresh_access_token()
-
     async def _request(
-        self, method: str, endpoint: str, data: dict[str, Any] | None = None
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        bypass_rate_limit: bool = False,
+    ) -> dict[str, Any]:
+        """Make an authenticated request, sharing identical in-flight GETs."""
+        method = method.upper()
+        if method != "GET":
+            return await self._send_request(
+                method, endpoint, data, bypass_rate_limit
+            )
+
+        key = (method, endpoint)
+        if (task := self._inflight.get(key)) is None:
+            task = self.hass.loop.create_task(
+                self._send_request(method, endpoint, data)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(
+                lambda done: self._inflight.get(key) is done
+                and self._inflight.pop(key)
+            )
+
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        bypass_rate_limit: bool = False,
     ) -> dict[str, Any]:
         """Make an authenticated request to the API."""
-        await self._ensure_token_valid()
-
-        url = f"{self.base_url}/{API_VERSION}{endpoint}"
-        headers = {
-            "x-app-version": API_APP_VERSION,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
-
+        self._ensure_token_valid()
+
+        url = self._url_prefix + endpoint
+        # Encode once with orjson; retries resend the same bytes
+        body = None if data is None else json_bytes(data)
+        timeout = (
+            _TIMEOUT_FAST
+            if method == "POST" or endpoint in _ACCOUNT_ENDPOINTS
+            else _TIMEOUT_SLOW
+        )
+
+        async def _call() -> dict[str, Any]:
+            if bypass_rate_limit:
+                # Still charged, so background polling slows down instead, and
+                # still held back while the server has asked us to pause
+                await self._rate_limiter.wait_for_pause()
+            else:
+                await self._rate_limiter.wait_for_token()
+
+            async with self.session.request(
+                method, url, headers=self._auth_headers, data=body, timeout=timeout
+            ) as response:
+                _check_status(response)
+                return await _decode(response, method)
+
+        description = f"Request to {endpoint}"
         try:
-            async with asyncio.timeout(30):
-                if method.upper() == "GET":
-                    async with self.session.get(url, headers=headers) as response:
-                        response.raise_for_status()
-                        return await response.json()
-                elif method.upper() == "POST":
-                    async with self.session.post(
-                        url, headers=headers, json=data
-                    ) as response:
-                        response.raise_for_status()
-                        if response.content_type == "application/json":
-                            return await response.json()
-                        return {}
+            return await self._call_with_retries(description, _call)
+        except KumoCloudAuthError:
+            if not self.refresh_token:
+                raise
+
+        # The token lapsed before the timer renewed it; refresh and retry once
+        await self.refresh_access_token()
+        return await self._call_with_retries(description, _call)
+
+    async def _call_with_retries(
+        self, description: str, call: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Run call, backing off and retrying on network faults and throttling."""
+        for attempt in range(API_MAX_RETRIES):
+            try:
+                return await call()
+            except (_Retryable, asyncio.TimeoutError, ClientConnectionError) as err:
+                reason = str(err) or "timeout"
+                if isinstance(err, _Retryable):
+                    self.counters[f"http_{err.status}"] += 1
+                elif isinstance(err, asyncio.TimeoutError):
+                    self.counters["timeout"] += 1
+                else:
+                    self.counters["connection_error"] += 1
+                if attempt == API_MAX_RETRIES - 1:
+                    self.counters["failed"] += 1
+                    raise KumoCloudConnectionError(
+                        f"{description} failed: {reason}"
+                    ) from err
+
+                retry_after = None
+                if isinstance(err, _Retryable) and err.retry_after is not None:
+                    retry_after = err.retry_after
+                    # The server asked the whole client to slow down, not just
+                    # this request, so make other callers wait as well
+                    self._rate_limiter.pause(
+                        min(retry_after, API_RETRY_AFTER_MAX_DELAY)
+                    )
+                delay = _backoff(attempt, retry_after)
+                self.counters["retries"] += 1
+                now = time.monotonic()
+                if (
+                    self._last_retry_warning is None
+                    or now - self._last_retry_warning >= _RETRY_WARNING_INTERVAL
+                ):
+                    self._last_retry_warning = now
+                    _LOGGER.warning(
+                        "%s failed (%s), retrying in %.1f seconds; further "
+                        "retries are only logged at debug level for %d seconds",
+                        description,
+                        reason,
+                        delay,
+                        _RETRY_WARNING_INTERVAL,
+                    )
+                else:
+                    _LOGGER.debug(
+                        "%s failed (%s), retrying in %.1f seconds",
+                        description,
+                        reason,
+                        delay,
+                    )
+                await asyncio.sleep(delay)
 
-        except asyncio.TimeoutError as err:
-            raise KumoCloudConnectionError("Request timeout") from err
-        except ClientResponseError as err:
-            if err.status == 401:
-                raise KumoCloudAuthError("Authentication failed") from err
-            raise KumoCloudConnectionError(f"HTTP error: {err.status}") from err
+        raise KumoCloudConnectionError(f"{description} failed")
 
     async def get_account_info(self) -> dict[str, Any]:
         """Get account information."""
@@ -192,13 +582,55 @@ class KumoCloudAPI:
         """Get device details."""
         return await self._request("GET", f"/devices/{device_serial}")
 
-    async def get_device_profile(self, device_serial: str) -> list[dict[str, Any]]:
-        """Get device profile information."""
-        return await self._request("GET", f"/devices/{device_serial}/profile")
+    async def async_load_profile_cache(self) -> None:
+        """Load device profiles saved by a previous run."""
+        if self._profile_store is None:
+            return
+        if stored := await self._profile_store.async_load():
+            self._profile_cache.update(stored)
+
+    async def get_device_profile(
+        self, device_serial: str, force: bool = False
+    ) -> list[dict[str, Any]]:
+        """Get device profile information, cached per device."""
+        if not force and device_serial in self._profile_cache:
+            return self._profile_cache[device_serial]
+
+        profile = await self._request("GET", f"/devices/{device_serial}/profile")
+        self._profile_cache[device_serial] = profile
+        if self._profile_store is not None:
+            self._profile_store.async_delay_save(lambda: self._profile_cache, 10)
+        return profile
+
+    async def _bounded(self, request: Awaitable[_T]) -> _T:
+        """Await a request while holding a slot of the bulk semaphore."""
+        async with self._bulk_semaphore:
+            return await request
+
+    async def get_devices_bulk(self, serials: list[str]) -> list[dict[str, Any]]:
+        """Get device details for several devices concurrently."""
+        return await asyncio.gather(
+            *(self._bounded(self.get_device_details(serial)) for serial in serials)
+        )
+
+    async def get_profiles_bulk(
+        self, serials: list[str]
+    ) -> list[list[dict[str, Any]]]:
+        """Get device profiles for several devices concurrently."""
+        return await asyncio.gather(
+            *(self._bounded(self.get_device_profile(serial)) for serial in serials)
+        )
 
     async def send_command(
         self, device_serial: str, commands: dict[str, Any]
     ) -> dict[str, Any]:
         """Send command to device."""
         data = {"deviceSerial": device_serial, "commands": commands}
-        return await self._request("POST", "/devices/send-command", data)
+        # User-facing writes skip the queue behind background polling
+        result = await self._request(
+            "POST", "/devices/send-command", data, bypass_rate_limit=True
+        )
+        # A read issued before the command would report the old state, so make
+        # the next read of this device start a fresh request
+        self._inflight.pop(("GET", f"/devices/{device_serial}"), None)
+        return result
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -13,7 +14,7 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -38,6 +39,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_EMPTY: dict[str, Any] = {}
+
 # Mapping from Kumo Cloud operation modes to Home Assistant HVAC modes
 KUMO_TO_HVAC_MODE = {
     OPERATION_MODE_OFF: HVACMode.OFF,
@@ -51,15 +54,23 @@ KUMO_TO_HVAC_MODE = {
 # Reverse mapping
 HVAC_TO_KUMO_MODE = {v: k for k, v in KUMO_TO_HVAC_MODE.items()}
 
+# Action for a powered-on unit in modes that do not depend on temperature
+_OP_TO_ACTION = {
+    OPERATION_MODE_HEAT: HVACAction.HEATING,
+    OPERATION_MODE_COOL: HVACAction.COOLING,
+    OPERATION_MODE_DRY: HVACAction.DRYING,
+    OPERATION_MODE_VENT: HVACAction.FAN,
+}
+
 # Fan speed mappings
-KUMO_FAN_SPEEDS = [FAN_SPEED_AUTO, FAN_SPEED_LOW, FAN_SPEED_MEDIUM, FAN_SPEED_HIGH]
+KUMO_FAN_SPEEDS = (FAN_SPEED_AUTO, FAN_SPEED_LOW, FAN_SPEED_MEDIUM, FAN_SPEED_HIGH)
 
 # Air direction mappings
-KUMO_AIR_DIRECTIONS = [
+KUMO_AIR_DIRECTIONS = (
     AIR_DIRECTION_HORIZONTAL,
     AIR_DIRECTION_VERTICAL,
     AIR_DIRECTION_SWING,
-]
+)
 
 
 async def async_setup_entry(
@@ -71,13 +82,12 @@ async def async_setup_entry(
     coordinator: KumoCloudDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     entities = []
-    for zone in coordinator.zones:
-        if "adapter" in zone and zone["adapter"]:
-            device_serial = zone["adapter"]["deviceSerial"]
-            zone_id = zone["id"]
+    for zone in coordinator.valid_zones:
+        device_serial = zone["adapter"]["deviceSerial"]
+        zone_id = zone["id"]
 
-            device = KumoCloudDevice(coordinator, zone_id, device_serial)
-            entities.append(KumoCloudClimate(device))
+        device = KumoCloudDevice(coordinator, zone_id, device_serial)
+        entities.append(KumoCloudClimate(device))
 
     async_add_entities(entities)
 
@@ -95,102 +105,57 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
         self.device = device
         self._attr_unique_id = device.unique_id
 
-        # Set up supported features based on device profile
-        self._setup_supported_features()
-
-    def _setup_supported_features(self) -> None:
-        """Set up supported features based on device capabilities."""
-        features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TURN_OFF
-            | ClimateEntityFeature.TURN_ON
-        )
-
-        profile = self.device.profile_data
-        if profile:
-            profile_data = profile[0] if isinstance(profile, list) else profile
-
-            # Check for fan speed support
-            if profile_data.get("numberOfFanSpeeds", 0) > 0:
-                features |= ClimateEntityFeature.FAN_MODE
-
-            # Check for vane/swing support
-            if profile_data.get("hasVaneSwing", False):
-                features |= ClimateEntityFeature.SWING_MODE
-
-            if profile_data.get("hasVaneDir", False):
-                features |= ClimateEntityFeature.SWING_MODE
-
-        self._attr_supported_features = features
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        zone_data = self.device.zone_data
-        device_data = self.device.device_data
-
-        model = device_data.get("model", {}).get("materialDescription", "Unknown Model")
-
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device.device_serial)},
+        # Name, model and serial do not change, so describe the device once
+        zone_data = device.zone_data
+        device_data = device.device_data
+        model = device_data.get("model") or _EMPTY
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device.device_serial)},
             name=zone_data.get("name", "Kumo Cloud Device"),
             manufacturer="Mitsubishi Electric",
-            model=model,
-            sw_version=device_data.get("model", {}).get("serialProfile"),
+            model=model.get("materialDescription", "Unknown Model"),
+            sw_version=model.get("serialProfile"),
             serial_number=device_data.get("serialNumber"),
         )
 
-    @property
-    def current_temperature(self) -> float | None:
-        """Return the current temperature."""
-        adapter = self.device.zone_data.get("adapter", {})
-        return adapter.get("roomTemp")
-
-    @property
-    def target_temperature(self) -> float | None:
-        """Return the target temperature."""
-        adapter = self.device.zone_data.get("adapter", {})
-        hvac_mode = self.hvac_mode
-
-        if hvac_mode == HVACMode.COOL:
-            return adapter.get("spCool")
-        elif hvac_mode == HVACMode.HEAT:
-            return adapter.get("spHeat")
-        elif hvac_mode == HVACMode.HEAT_COOL:
-            # For auto mode, could return either cool or heat setpoint
-            # Return the cool setpoint as default
-            return adapter.get("spCool") or adapter.get("spHeat")
+        # Profile-derived capabilities are static, so work them out up front
+        self._profile: Sequence[dict[str, Any]] | None = None
+        self._precompute_profile()
+        self._update_cached_data()
 
-        return None
+    def _precompute_profile(self) -> None:
+        """Derive features, modes and limits from the device profile."""
+        profile = self._profile = self.device.profile_data
+        profile_data = (
+            profile[0] if isinstance(profile, (list, tuple)) and profile else profile
+        ) or {}
 
-    @property
-    def hvac_mode(self) -> HVACMode:
-        """Return current HVAC mode."""
-        # Check both adapter (zone) and device data for most current status
-        adapter = self.device.zone_data.get("adapter", {})
-        device_data = self.device.device_data
-
-        # Use device data if available (more current), otherwise use adapter data
-        operation_mode = device_data.get(
-            "operationMode", adapter.get("operationMode", OPERATION_MODE_OFF)
+        features = (
+            ClimateEntityFeature.TARGET_TEMPERATURE
+            | ClimateEntityFeature.TURN_OFF
+            | ClimateEntityFeature.TURN_ON
         )
-        power = device_data.get("power", adapter.get("power", 0))
 
-        # If power is 0, device is off regardless of operation mode
-        if power == 0:
-            return HVACMode.OFF
+        # Check for fan speed support
+        try:
+            num_fan_speeds = int(profile_data.get("numberOfFanSpeeds", 0))
+        except (TypeError, ValueError):
+            # Unreadable count, so offer every speed
+            num_fan_speeds = len(KUMO_FAN_SPEEDS) - 1
+        if num_fan_speeds > 0:
+            features |= ClimateEntityFeature.FAN_MODE
+
+        # Check for vane/swing support
+        has_swing = profile_data.get("hasVaneDir", False) or profile_data.get(
+            "hasVaneSwing", False
+        )
+        if has_swing:
+            features |= ClimateEntityFeature.SWING_MODE
 
-        return KUMO_TO_HVAC_MODE.get(operation_mode, HVACMode.OFF)
+        self._attr_supported_features = features
 
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return the list of available HVAC modes."""
         modes = [HVACMode.OFF]
-
-        profile = self.device.profile_data
-        if profile:
-            profile_data = profile[0] if isinstance(profile, list) else profile
-
+        if profile_data:
             # Add modes based on device capabilities
             if profile_data.get("hasModeHeat", False):
                 modes.append(HVACMode.HEAT)
@@ -206,136 +171,97 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
             # Auto mode if device supports both heat and cool
             if profile_data.get("hasModeHeat", False):
                 modes.append(HVACMode.HEAT_COOL)
+        self._attr_hvac_modes = modes
 
-        return modes
+        # Auto plus one mode per supported speed, up to high
+        self._attr_fan_modes = (
+            list(KUMO_FAN_SPEEDS[: 1 + min(num_fan_speeds, 3)])
+            if num_fan_speeds > 0
+            else None
+        )
+        self._attr_swing_modes = list(KUMO_AIR_DIRECTIONS) if has_swing else None
 
-    @property
-    def hvac_action(self) -> HVACAction | None:
-        """Return current HVAC action based on actual device status."""
-        hvac_mode = self.hvac_mode
-        if hvac_mode == HVACMode.OFF:
-            return HVACAction.OFF
+        if profile_data:
+            # Widest range across the heat and cool setpoints
+            min_setpoints = profile_data.get("minimumSetPoints", {})
+            max_setpoints = profile_data.get("maximumSetPoints", {})
+            self._attr_min_temp = min(
+                min_setpoints.get("heat", 16), min_setpoints.get("cool", 16)
+            )
+            self._attr_max_temp = max(
+                max_setpoints.get("heat", 30), max_setpoints.get("cool", 30)
+            )
+        else:
+            self._attr_min_temp = 16.0
+            self._attr_max_temp = 30.0
 
+    def _update_cached_data(self) -> None:
+        """Derive this update's state from the adapter and device data once."""
         # Check both adapter (zone) and device data for most current status
-        adapter = self.device.zone_data.get("adapter", {})
-        device_data = self.device.device_data
+        adapter = self._adapter = self.device.zone_data.get("adapter") or {}
+        device_data = self._dd = self.device.device_data or {}
 
         # Use device data if available (more current), otherwise use adapter data
-        power = device_data.get("power", adapter.get("power", 0))
         operation_mode = device_data.get(
             "operationMode", adapter.get("operationMode", OPERATION_MODE_OFF)
         )
+        power = device_data.get("power", adapter.get("power", 0))
 
+        # If power is 0, device is off regardless of operation mode
         if power == 0:
-            return HVACAction.OFF
-
-        # If device is on and has a valid operation mode, show it as active
-        if operation_mode == OPERATION_MODE_HEAT:
-            # For heating mode, show as heating if power is on
-            return HVACAction.HEATING
-        elif operation_mode == OPERATION_MODE_COOL:
-            # For cooling mode, show as cooling if power is on
-            return HVACAction.COOLING
-        elif operation_mode == OPERATION_MODE_DRY:
-            return HVACAction.DRYING
-        elif operation_mode == OPERATION_MODE_VENT:
-            return HVACAction.FAN
-        elif operation_mode == OPERATION_MODE_AUTO:
-            # For auto mode, determine action based on current vs target temperature
-            current_temp = self.current_temperature
-            target_temp = self.target_temperature
-
-            if current_temp is not None and target_temp is not None:
+            hvac_mode = HVACMode.OFF
+        else:
+            hvac_mode = KUMO_TO_HVAC_MODE.get(operation_mode, HVACMode.OFF)
+
+        current_temp = adapter.get("roomTemp")
+        if hvac_mode == HVACMode.COOL:
+            target_temp = adapter.get("spCool")
+        elif hvac_mode == HVACMode.HEAT:
+            target_temp = adapter.get("spHeat")
+        elif hvac_mode == HVACMode.HEAT_COOL:
+            # For auto mode, could return either cool or heat setpoint
+            # Return the cool setpoint as default
+            target_temp = adapter.get("spCool") or adapter.get("spHeat")
+        else:
+            target_temp = None
+
+        if hvac_mode == HVACMode.OFF:
+            hvac_action = HVACAction.OFF
+        elif (action := _OP_TO_ACTION.get(operation_mode)) is not None:
+            # If device is on and has a valid operation mode, show it as active
+            hvac_action = action
+        else:
+            # If power is on but we can't determine the action, show as idle
+            hvac_action = HVACAction.IDLE
+            if (
+                operation_mode == OPERATION_MODE_AUTO
+                and current_temp is not None
+                and target_temp is not None
+            ):
+                # For auto mode, determine action based on current vs target
                 temp_diff = current_temp - target_temp
                 if temp_diff > 1.0:  # More than 1 degree above target
-                    return HVACAction.COOLING
+                    hvac_action = HVACAction.COOLING
                 elif temp_diff < -1.0:  # More than 1 degree below target
-                    return HVACAction.HEATING
-
-            # Default to idle for auto mode if we can't determine
-            return HVACAction.IDLE
-
-        # If power is on but we can't determine the action, show as idle
-        return HVACAction.IDLE
-
-    @property
-    def fan_mode(self) -> str | None:
-        """Return current fan mode."""
-        # Check device data first, then adapter data
-        device_data = self.device.device_data
-        adapter = self.device.zone_data.get("adapter", {})
-        return device_data.get("fanSpeed", adapter.get("fanSpeed"))
+                    hvac_action = HVACAction.HEATING
 
-    @property
-    def fan_modes(self) -> list[str] | None:
-        """Return the list of available fan modes."""
-        profile = self.device.profile_data
-        if not profile:
-            return None
-
-        profile_data = profile[0] if isinstance(profile, list) else profile
-        num_fan_speeds = profile_data.get("numberOfFanSpeeds", 0)
-
-        if num_fan_speeds == 0:
-            return None
-
-        # Return fan modes based on number of speeds supported
-        modes = [FAN_SPEED_AUTO]
-        if num_fan_speeds >= 1:
-            modes.append(FAN_SPEED_LOW)
-        if num_fan_speeds >= 2:
-            modes.append(FAN_SPEED_MEDIUM)
-        if num_fan_speeds >= 3:
-            modes.append(FAN_SPEED_HIGH)
-
-        return modes
-
-    @property
-    def swing_mode(self) -> str | None:
-        """Return current swing mode."""
+        self._attr_hvac_mode = hvac_mode
+        self._attr_hvac_action = hvac_action
+        self._attr_current_temperature = current_temp
+        self._attr_target_temperature = target_temp
         # Check device data first, then adapter data
-        device_data = self.device.device_data
-        adapter = self.device.zone_data.get("adapter", {})
-        return device_data.get("airDirection", adapter.get("airDirection"))
-
-    @property
-    def swing_modes(self) -> list[str] | None:
-        """Return the list of available swing modes."""
-        profile = self.device.profile_data
-        if not profile:
-            return None
-
-        profile_data = profile[0] if isinstance(profile, list) else profile
-
-        modes = []
-        if profile_data.get("hasVaneDir", False) or profile_data.get(
-            "hasVaneSwing", False
-        ):
-            modes.extend(KUMO_AIR_DIRECTIONS)
-
-        return modes if modes else None
-
-    @property
-    def min_temp(self) -> float:
-        """Return minimum temperature."""
-        profile = self.device.profile_data
-        if profile:
-            profile_data = profile[0] if isinstance(profile, list) else profile
-            min_setpoints = profile_data.get("minimumSetPoints", {})
-            # Return the minimum of heat and cool setpoints
-            return min(min_setpoints.get("heat", 16), min_setpoints.get("cool", 16))
-        return 16.0
+        self._attr_fan_mode = device_data.get("fanSpeed", adapter.get("fanSpeed"))
+        self._attr_swing_mode = device_data.get(
+            "airDirection", adapter.get("airDirection")
+        )
 
-    @property
-    def max_temp(self) -> float:
-        """Return maximum temperature."""
-        profile = self.device.profile_data
-        if profile:
-            profile_data = profile[0] if isinstance(profile, list) else profile
-            max_setpoints = profile_data.get("maximumSetPoints", {})
-            # Return the maximum of heat and cool setpoints
-            return max(max_setpoints.get("heat", 30), max_setpoints.get("cool", 30))
-        return 30.0
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self.device.profile_data is not self._profile:
+            self._precompute_profile()
+        self._update_cached_data()
+        super()._handle_coordinator_update()
 
     @property
     def target_temperature_step(self) -> float:
@@ -347,12 +273,21 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
         """Return True if entity is available."""
         return self.device.available and self.coordinator.last_update_success
 
+    def _current_setpoints(self) -> tuple[float | None, float | None]:
+        """Return the current cool and heat setpoints."""
+        # Use device data if available, otherwise adapter data
+        device_data = self._dd
+        adapter = self._adapter
+        return (
+            device_data.get("spCool", adapter.get("spCool")),
+            device_data.get("spHeat", adapter.get("spHeat")),
+        )
+
     async def _send_command_and_refresh(self, commands: dict[str, Any]) -> None:
         """Send command and ensure fresh status update."""
+        # send_command refreshes the device, which notifies the coordinator's
+        # listeners; that update writes this entity's state
         await self.device.send_command(commands)
-        # The device.send_command method now handles refreshing the device status
-        # Also trigger a state update for this entity to reflect changes immediately
-        self.async_write_ha_state()
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target HVAC mode."""
@@ -364,12 +299,7 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
                 commands = {"operationMode": kumo_mode}
 
                 # Include current setpoints to maintain them
-                adapter = self.device.zone_data.get("adapter", {})
-                device_data = self.device.device_data
-
-                # Use device data if available, otherwise adapter data
-                sp_cool = device_data.get("spCool", adapter.get("spCool"))
-                sp_heat = device_data.get("spHeat", adapter.get("spHeat"))
+                sp_cool, sp_heat = self._current_setpoints()
 
                 if sp_cool is not None:
                     commands["spCool"] = sp_cool
@@ -387,19 +317,16 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
         hvac_mode = self.hvac_mode
         commands = {}
 
-        adapter = self.device.zone_data.get("adapter", {})
-        device_data = self.device.device_data
+        sp_cool, sp_heat = self._current_setpoints()
 
         if hvac_mode == HVACMode.COOL:
             commands["spCool"] = target_temp
             # Maintain heat setpoint
-            sp_heat = device_data.get("spHeat", adapter.get("spHeat"))
             if sp_heat is not None:
                 commands["spHeat"] = sp_heat
         elif hvac_mode == HVACMode.HEAT:
             commands["spHeat"] = target_temp
             # Maintain cool setpoint
-            sp_cool = device_data.get("spCool", adapter.get("spCool"))
             if sp_cool is not None:
                 commands["spCool"] = sp_cool
         elif hvac_mode == HVACMode.HEAT_COOL:
@@ -421,12 +348,9 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
     async def async_turn_on(self) -> None:
         """Turn the entity on."""
         # Turn on with the last used mode, or cool mode if no previous mode
-        adapter = self.device.zone_data.get("adapter", {})
-        device_data = self.device.device_data
-
         # Use device data if available, otherwise adapter data
-        operation_mode = device_data.get(
-            "operationMode", adapter.get("operationMode", OPERATION_MODE_COOL)
+        operation_mode = self._dd.get(
+            "operationMode", self._adapter.get("operationMode", OPERATION_MODE_COOL)
         )
 
         # If the operation mode is "off", default to cool
@@ -436,8 +360,7 @@ class KumoCloudClimate(CoordinatorEntity, ClimateEntity):
         commands = {"operationMode": operation_mode}
 
         # Include setpoints
-        sp_cool = device_data.get("spCool", adapter.get("spCool"))
-        sp_heat = device_data.get("spHeat", adapter.get("spHeat"))
+        sp_cool, sp_heat = self._current_setpoints()
 
         if sp_cool is not None:
             commands["spCool"] = sp_cool
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -36,11 +37,10 @@ async def validate_auth(
             user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
         )
 
-        # Get account info
-        account_info = await api.get_account_info()
-
-        # Get sites
-        sites = await api.get_sites()
+        # Account info and sites are independent, so fetch them together
+        account_info, sites = await asyncio.gather(
+            api.get_account_info(), api.get_sites()
+        )
 
         return {
             "login_result": login_result,
@@ -146,6 +146,7 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
                 CONF_SITE_ID: self.data[CONF_SITE_ID],
                 "access_token": self.api.access_token,
                 "refresh_token": self.api.refresh_token,
+                "token_expires_at": self.api.token_expiry_timestamp,
             },
         )
 
@@ -178,6 +179,7 @@ class KumoCloudConfigFlow(ConfigFlow, domain=DOMAIN):
                         CONF_PASSWORD: user_input[CONF_PASSWORD],
                         "access_token": info["api"].access_token,
                         "refresh_token": info["api"].refresh_token,
+                        "token_expires_at": info["api"].token_expiry_timestamp,
                     },
                 )
 
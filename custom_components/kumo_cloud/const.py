@@ -10,10 +10,25 @@ API_BASE_URL = "https://app-prod.kumocloud.com"
 API_VERSION = "v3"
 API_APP_VERSION = "3.0.9"
 
+# Storage constants
+STORAGE_VERSION = 1
+STORAGE_KEY_PROFILES = f"{DOMAIN}.{{entry_id}}.device_profiles"
+
 # Token refresh constants
 TOKEN_REFRESH_INTERVAL = 1200  # 20 minutes in seconds
 TOKEN_EXPIRY_MARGIN = 300  # 5 minutes margin in seconds
 
+# Rate limiting constants
+API_RATE_LIMIT = 0.5  # sustained requests per second
+API_RATE_BURST = 8  # requests allowed back to back before pacing kicks in
+API_MAX_CONCURRENT_REQUESTS = 4  # per-device fan-out in flight at once
+
+# Retry constants
+API_MAX_RETRIES = 3
+API_RETRY_BASE_DELAY = 1.0  # seconds
+API_RETRY_MAX_DELAY = 30.0  # seconds
+API_RETRY_AFTER_MAX_DELAY = 60.0  # seconds, ceiling on server Retry-After
+
 # Device constants
 DEVICE_SERIAL = "deviceSerial"
 ZONE_ID = "zoneId"
@@ -0,0 +1,11 @@
+"""Fixtures for Kumo Cloud tests."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Allow Home Assistant to load the custom integration in every test."""
+    return
@@ -0,0 +1,250 @@
+"""Tests for the Kumo Cloud API client."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+    AiohttpClientMockResponse,
+)
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.kumo_cloud.api import (
+    KumoCloudAPI,
+    KumoCloudAuthError,
+    _backoff,
+    _parse_retry_after,
+    _TokenBucket,
+)
+from custom_components.kumo_cloud.const import (
+    API_RETRY_AFTER_MAX_DELAY,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
+)
+
+BASE_URL = "https://app-prod.kumocloud.com/v3"
+
+
+class FakeClock:
+    """Monotonic clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        """Start the clock at an arbitrary point."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+async def api(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> KumoCloudAPI:
+    """Return a client that already holds a token pair."""
+    client = KumoCloudAPI(hass)
+    client.set_tokens("access-1", "refresh-1")
+    return client
+
+
+def _response(method: str, url, **kwargs) -> AiohttpClientMockResponse:
+    """Build a mocked response for a side effect."""
+    return AiohttpClientMockResponse(method, url, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("5", 5.0),
+        ("2.5", 2.5),
+        ("-3", 0.0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    """Test delta-seconds and malformed Retry-After values."""
+    assert _parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date() -> None:
+    """Test a Retry-After given as an HTTP-date."""
+    future = datetime.now(UTC) + timedelta(seconds=30)
+    assert 25 < _parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+
+    past = datetime.now(UTC) - timedelta(seconds=30)
+    assert _parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_backoff() -> None:
+    """Test exponential growth, the caps and the Retry-After floor."""
+    with patch("custom_components.kumo_cloud.api.random.random", return_value=0.0):
+        assert _backoff(0) == API_RETRY_BASE_DELAY
+        assert _backoff(2) == API_RETRY_BASE_DELAY * 4
+        assert _backoff(20) == API_RETRY_MAX_DELAY
+        assert _backoff(0, retry_after=10.0) == 10.0
+        assert _backoff(3, retry_after=0.5) == API_RETRY_BASE_DELAY * 8
+        assert _backoff(0, retry_after=10_000.0) == API_RETRY_AFTER_MAX_DELAY
+
+    with patch("custom_components.kumo_cloud.api.random.random", return_value=1.0):
+        assert _backoff(0) == API_RETRY_BASE_DELAY * 1.5
+
+
+def test_token_bucket_reserve() -> None:
+    """Test the burst is free and later reservations queue up."""
+    clock = FakeClock()
+    with patch("custom_components.kumo_cloud.api.time.monotonic", clock):
+        bucket = _TokenBucket(rate=2.0, burst=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        # The balance goes negative, so each caller waits behind the last
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1.0
+
+        clock.now += 1.0
+        assert bucket.reserve() == 0.5
+
+
+def test_token_bucket_pause() -> None:
+    """Test a pause holds back reservations and is never shortened."""
+    clock = FakeClock()
+    with patch("custom_components.kumo_cloud.api.time.monotonic", clock):
+        bucket = _TokenBucket(rate=2.0, burst=5)
+        bucket.pause(10.0)
+        assert bucket.reserve() == 10.0
+
+        bucket.pause(1.0)
+        assert bucket.reserve() == 10.0
+
+        clock.now += 10.0
+        assert bucket.reserve() == 0.0
+
+
+async def test_concurrent_gets_are_coalesced(
+    api: KumoCloudAPI, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test identical concurrent GETs share one request."""
+    aioclient_mock.get(f"{BASE_URL}/devices/abc", json={"power": 1})
+
+    results = await asyncio.gather(
+        *(api.get_device_details("abc") for _ in range(3))
+    )
+
+    assert results == [{"power": 1}] * 3
+    assert aioclient_mock.call_count == 1
+    assert not api._inflight
+
+
+async def test_refresh_after_command_does_not_join_earlier_read(
+    api: KumoCloudAPI, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a read after a command is not served by a poll issued before it."""
+    state = {"operationMode": "off"}
+    release_poll = asyncio.Event()
+    calls = 0
+
+    async def _device(method, url, data):
+        nonlocal calls
+        calls += 1
+        snapshot = dict(state)
+        if calls == 1:
+            # The poll reads the old state and is slow to answer
+            await release_poll.wait()
+        return _response(method, url, json=snapshot)
+
+    async def _command(method, url, data):
+        state["operationMode"] = "cool"
+        return _response(method, url, json={})
+
+    aioclient_mock.get(f"{BASE_URL}/devices/abc", side_effect=_device)
+    aioclient_mock.post(f"{BASE_URL}/devices/send-command", side_effect=_command)
+
+    poll = asyncio.ensure_future(api.get_device_details("abc"))
+    while calls == 0:
+        await asyncio.sleep(0)
+
+    await api.send_command("abc", {"operationMode": "cool"})
+    refreshed = asyncio.ensure_future(api.get_device_details("abc"))
+    await asyncio.sleep(0)
+    release_poll.set()
+
+    assert await poll == {"operationMode": "off"}
+    assert await refreshed == {"operationMode": "cool"}
+    assert calls == 2
+
+
+async def test_unauthorized_request_refreshes_and_retries_once(
+    api: KumoCloudAPI, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a 401 triggers one token refresh and one retry."""
+    seen_tokens = []
+
+    async def _device(method, url, data):
+        seen_tokens.append(api.access_token)
+        if api.access_token == "access-1":
+            return _response(method, url, status=401)
+        return _response(method, url, json={"power": 1})
+
+    aioclient_mock.get(f"{BASE_URL}/devices/abc", side_effect=_device)
+    aioclient_mock.post(
+        f"{BASE_URL}/refresh", json={"access": "access-2", "refresh": "refresh-2"}
+    )
+
+    assert await api.get_device_details("abc") == {"power": 1}
+    assert seen_tokens == ["access-1", "access-2"]
+    assert api.refresh_token == "refresh-2"
+
+
+async def test_persistent_unauthorized_is_not_retried_forever(
+    api: KumoCloudAPI, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a request still rejected after a refresh raises an auth error."""
+    aioclient_mock.get(f"{BASE_URL}/devices/abc", status=401)
+    aioclient_mock.post(
+        f"{BASE_URL}/refresh", json={"access": "access-2", "refresh": "refresh-2"}
+    )
+
+    with pytest.raises(KumoCloudAuthError):
+        await api.get_device_details("abc")
+
+    methods = [call[0] for call in aioclient_mock.mock_calls]
+    assert methods == ["GET", "POST", "GET"]
+
+
+async def test_close_cancels_pending_refresh_and_inflight_requests(
+    api: KumoCloudAPI, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test close() stops work that outlives its callers."""
+    never = asyncio.Event()
+    saved = []
+    api.token_update_callback = lambda: saved.append(api.access_token)
+
+    async def _hang(method, url, data):
+        await never.wait()
+
+    aioclient_mock.post(f"{BASE_URL}/refresh", side_effect=_hang)
+    aioclient_mock.get(f"{BASE_URL}/devices/abc", side_effect=_hang)
+
+    refresh = asyncio.ensure_future(api.refresh_access_token())
+    read = asyncio.ensure_future(api.get_device_details("abc"))
+    while aioclient_mock.call_count < 2:
+        await asyncio.sleep(0)
+    pending = api._pending_refresh
+    inflight = list(api._inflight.values())
+
+    await api.close()
+
+    assert pending.cancelled()
+    assert all(task.cancelled() for task in inflight)
+    assert not api._inflight
+    for task in (refresh, read):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert saved == []
@@ -0,0 +1,179 @@
+"""Tests for the Kumo Cloud climate entity."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.components.climate import (
+    ClimateEntityFeature,
+    HVACAction,
+    HVACMode,
+)
+from homeassistant.core import HomeAssistant
+
+from custom_components.kumo_cloud import (
+    KumoCloudDataUpdateCoordinator,
+    KumoCloudDevice,
+)
+from custom_components.kumo_cloud.api import KumoCloudAPI
+from custom_components.kumo_cloud.climate import KumoCloudClimate
+from custom_components.kumo_cloud.const import DOMAIN
+
+SERIAL = "abc"
+ZONE_ID = "zone-1"
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> KumoCloudDataUpdateCoordinator:
+    """Return a coordinator holding one zone with an indoor unit."""
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    coordinator = KumoCloudDataUpdateCoordinator(
+        hass, entry, KumoCloudAPI(hass), "site"
+    )
+    coordinator.zones = [
+        {
+            "id": ZONE_ID,
+            "name": "Living Room",
+            "adapter": {"deviceSerial": SERIAL, "connected": True},
+        }
+    ]
+    coordinator.valid_zones = tuple(coordinator.zones)
+    return coordinator
+
+
+def _entity(
+    coordinator: KumoCloudDataUpdateCoordinator,
+    device_data: dict[str, Any] | None = None,
+    profile: Any = None,
+) -> KumoCloudClimate:
+    """Build a climate entity for the test zone."""
+    coordinator.devices = {SERIAL: device_data or {}}
+    coordinator.device_profiles = {} if profile is None else {SERIAL: profile}
+    return KumoCloudClimate(KumoCloudDevice(coordinator, ZONE_ID, SERIAL))
+
+
+@pytest.mark.parametrize("profile", [None, [], {}, [{}]])
+async def test_missing_profile(
+    coordinator: KumoCloudDataUpdateCoordinator, profile: Any
+) -> None:
+    """Test a missing or empty profile falls back to the basics."""
+    entity = _entity(coordinator, profile=profile)
+
+    assert entity.hvac_modes == [HVACMode.OFF]
+    assert entity.fan_modes is None
+    assert entity.swing_modes is None
+    assert entity.min_temp == 16.0
+    assert entity.max_temp == 30.0
+    assert entity.supported_features == (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_OFF
+        | ClimateEntityFeature.TURN_ON
+    )
+
+
+async def test_missing_profile_is_stable(
+    coordinator: KumoCloudDataUpdateCoordinator,
+) -> None:
+    """Test a device without a profile is not recomputed on every update."""
+    entity = _entity(coordinator)
+
+    assert entity.device.profile_data is entity._profile
+
+
+async def test_full_profile(coordinator: KumoCloudDataUpdateCoordinator) -> None:
+    """Test capabilities are derived from a profile list."""
+    entity = _entity(
+        coordinator,
+        profile=[
+            {
+                "numberOfFanSpeeds": 3,
+                "hasVaneDir": True,
+                "hasModeHeat": True,
+                "hasModeDry": True,
+                "hasModeVent": True,
+                "minimumSetPoints": {"heat": 10, "cool": 16},
+                "maximumSetPoints": {"heat": 28, "cool": 31},
+            }
+        ],
+    )
+
+    assert entity.hvac_modes == [
+        HVACMode.OFF,
+        HVACMode.HEAT,
+        HVACMode.COOL,
+        HVACMode.DRY,
+        HVACMode.FAN_ONLY,
+        HVACMode.HEAT_COOL,
+    ]
+    assert entity.fan_modes == ["auto", "low", "medium", "high"]
+    assert entity.swing_modes == ["horizontal", "vertical", "swing"]
+    assert entity.min_temp == 10
+    assert entity.max_temp == 31
+    assert entity.supported_features & ClimateEntityFeature.FAN_MODE
+    assert entity.supported_features & ClimateEntityFeature.SWING_MODE
+
+
+@pytest.mark.parametrize(
+    ("fan_speeds", "expected"),
+    [
+        (1, ["auto", "low"]),
+        (2.0, ["auto", "low", "medium"]),
+        ("2", ["auto", "low", "medium"]),
+        (7, ["auto", "low", "medium", "high"]),
+        ("many", ["auto", "low", "medium", "high"]),
+        (None, ["auto", "low", "medium", "high"]),
+        (0, None),
+    ],
+)
+async def test_odd_fan_speed_counts(
+    coordinator: KumoCloudDataUpdateCoordinator,
+    fan_speeds: Any,
+    expected: list[str] | None,
+) -> None:
+    """Test fan modes tolerate counts that are not plain integers."""
+    entity = _entity(coordinator, profile={"numberOfFanSpeeds": fan_speeds})
+
+    assert entity.fan_modes == expected
+
+
+@pytest.mark.parametrize(
+    ("device_data", "mode", "action", "target"),
+    [
+        ({"power": 0, "operationMode": "cool"}, HVACMode.OFF, HVACAction.OFF, None),
+        (
+            {"power": 1, "operationMode": "heat", "spHeat": 21},
+            HVACMode.HEAT,
+            HVACAction.HEATING,
+            21,
+        ),
+        (
+            {"power": 1, "operationMode": "auto", "roomTemp": 25, "spCool": 22},
+            HVACMode.HEAT_COOL,
+            HVACAction.COOLING,
+            22,
+        ),
+        (
+            {"power": 1, "operationMode": "auto", "roomTemp": 22, "spCool": 22},
+            HVACMode.HEAT_COOL,
+            HVACAction.IDLE,
+            22,
+        ),
+    ],
+)
+async def test_state_derivation(
+    coordinator: KumoCloudDataUpdateCoordinator,
+    device_data: dict[str, Any],
+    mode: HVACMode,
+    action: HVACAction,
+    target: float | None,
+) -> None:
+    """Test mode, action and target come from one pass over the data."""
+    coordinator.zones[0]["adapter"].update(device_data)
+    entity = _entity(coordinator, device_data=device_data)
+
+    assert entity.hvac_mode == mode
+    assert entity.hvac_action == action
+    assert entity.target_temperature == target